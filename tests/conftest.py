@@ -1,30 +1,149 @@
+import numpy as np
 import pytest
 
-# Import vtk_override so that it's classes override VTK
-import vtk_override  # noqa
 from vtk_override.utils.sources import Cube, Hexbeam, Plane, Sphere, Wavelet
 
 
-@pytest.fixture
-def sphere():
+def pytest_configure(config):
+    # Import vtk_override exactly once, before any collection, so its VTK
+    # class overrides are guaranteed to be registered up front. Also pay
+    # for the heavy VTK binding import here instead of inside whichever
+    # test module happens to need the constants first.
+    import vtkmodules.vtkCommonDataModel  # noqa
+
+    import vtk_override  # noqa
+
+
+# Running the VTK source filters is far more expensive than deep copying
+# their output, so build each dataset once per session and hand each test
+# a fresh deep copy that it is free to mutate.
+
+
+@pytest.fixture(scope="session")
+def _sphere_master():
     return Sphere()
 
 
-@pytest.fixture
-def cube():
+@pytest.fixture(scope="session")
+def _cube_master():
     return Cube()
 
 
-@pytest.fixture
-def wavelet():
+@pytest.fixture(scope="session")
+def _wavelet_master():
     return Wavelet()
 
 
-@pytest.fixture
-def plane():
+@pytest.fixture(scope="session")
+def _plane_master():
     return Plane()
 
 
-@pytest.fixture
-def hexbeam():
+@pytest.fixture(scope="session")
+def _hexbeam_master():
     return Hexbeam()
+
+
+@pytest.fixture(scope="session")
+def _tiny_plane_master():
+    return Plane(i_resolution=1, j_resolution=1)
+
+
+# Cleared masters for tests that start by wiping the source's default
+# arrays; the clear_data() iteration is paid once per session this way.
+@pytest.fixture(scope="session")
+def _sphere_cleared_master(_sphere_master):
+    mesh = _sphere_master.copy(deep=True)
+    mesh.clear_data()
+    return mesh
+
+
+@pytest.fixture(scope="session")
+def _cube_cleared_master(_cube_master):
+    mesh = _cube_master.copy(deep=True)
+    mesh.clear_data()
+    return mesh
+
+
+@pytest.fixture(scope="session")
+def _wavelet_cleared_master(_wavelet_master):
+    mesh = _wavelet_master.copy(deep=True)
+    mesh.clear_data()
+    return mesh
+
+
+@pytest.fixture(scope="session")
+def _plane_cleared_master(_plane_master):
+    mesh = _plane_master.copy(deep=True)
+    mesh.clear_data()
+    return mesh
+
+
+@pytest.fixture(scope="module")
+def rng():
+    """Seeded PCG64 generator, much faster than the global Mersenne Twister."""
+    return np.random.default_rng(0)
+
+
+@pytest.fixture(scope="module")
+def wavelet_ro(_wavelet_master):
+    """Share the session master with tests that only read from the wavelet."""
+    return _wavelet_master
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _wavelet_master_guard(_wavelet_master):
+    """Catch read-only tests that mutate the shared wavelet master."""
+    keys = _wavelet_master.point_data.keys()
+    yield
+    assert _wavelet_master.point_data.keys() == keys
+
+
+@pytest.fixture
+def sphere(_sphere_master):
+    return _sphere_master.copy(deep=True)
+
+
+@pytest.fixture
+def cube(_cube_master):
+    return _cube_master.copy(deep=True)
+
+
+@pytest.fixture
+def wavelet(_wavelet_master):
+    return _wavelet_master.copy(deep=True)
+
+
+@pytest.fixture
+def plane(_plane_master):
+    return _plane_master.copy(deep=True)
+
+
+@pytest.fixture
+def hexbeam(_hexbeam_master):
+    return _hexbeam_master.copy(deep=True)
+
+
+@pytest.fixture
+def tiny_plane(_tiny_plane_master):
+    return _tiny_plane_master.copy(deep=True)
+
+
+@pytest.fixture
+def cleared_sphere(_sphere_cleared_master):
+    return _sphere_cleared_master.copy(deep=True)
+
+
+@pytest.fixture
+def cleared_cube(_cube_cleared_master):
+    return _cube_cleared_master.copy(deep=True)
+
+
+@pytest.fixture
+def cleared_wavelet(_wavelet_cleared_master):
+    return _wavelet_cleared_master.copy(deep=True)
+
+
+@pytest.fixture
+def cleared_plane(_plane_cleared_master):
+    return _plane_cleared_master.copy(deep=True)
@@ -10,7 +10,7 @@ from vtkmodules.vtkCommonDataModel import (
 )
 
 
-def test_shallow_copy():
+def test_shallow_copy(rng):
     # Case 1
     original = vtkPolyData()
     original.points = np.array(
@@ -23,16 +23,16 @@ def test_shallow_copy():
     )
     copy = original.copy(deep=False)
     copy.points[:] = 2.8
-    assert np.allclose(original.points, copy.points)
+    assert np.array_equal(original.points, copy.points)
     # Case 2
     original = vtkPolyData()
     ###
     # TODO: remove this and figure out how to rectify original's `GetPoints()->None`
-    original.points = np.random.rand(5, 3)
+    original.points = rng.random((5, 3))
     ###
     copy = original.copy(deep=False)
-    copy.points = np.random.rand(5, 3)
-    assert np.allclose(original.points, copy.points)
+    copy.points = rng.random((5, 3))
+    assert np.array_equal(original.points, copy.points)
 
 
 def test_deep_copy(sphere):
@@ -41,55 +41,60 @@ def test_deep_copy(sphere):
     assert copy.actual_memory_size == sphere.actual_memory_size
 
 
-def test_copy_structure_poly(sphere):
-    copy = vtkPolyData()
-    copy.copy_structure(sphere)
-    assert copy.bounds == sphere.bounds
-    assert copy.center == sphere.center
-    assert np.allclose(copy.points, sphere.points)
-    assert np.allclose(copy.faces, sphere.faces)
-
-
-def test_copy_structure_image(wavelet):
-    copy = vtkImageData()
-    copy.copy_structure(wavelet)
-    assert copy.bounds == wavelet.bounds
-    assert copy.center == wavelet.center
-    assert copy.dimensions == wavelet.dimensions
-    assert copy.spacing == wavelet.spacing
-    assert copy.origin == wavelet.origin
+@pytest.mark.parametrize(
+    "master_name,target_cls",
+    [("sphere", vtkPolyData), ("wavelet", vtkImageData)],
+)
+def test_copy_structure(request, master_name, target_cls):
+    mesh = request.getfixturevalue(master_name)
+    copy = target_cls()
+    copy.copy_structure(mesh)
+    assert copy.bounds == mesh.bounds
+    assert copy.center == mesh.center
+    if target_cls is vtkPolyData:
+        assert np.array_equal(copy.points, mesh.points)
+        assert np.array_equal(copy.faces, mesh.faces)
+    else:
+        assert copy.dimensions == mesh.dimensions
+        assert copy.spacing == mesh.spacing
+        assert copy.origin == mesh.origin
 
 
 def test_cast_to_unstructured_grid(sphere):
     casted = sphere.cast_to_unstructured_grid()
     assert isinstance(casted, vtkUnstructuredGrid)
-    assert np.allclose(sphere.points, casted.points)
+    assert np.array_equal(sphere.points, casted.points)
 
 
 def test_cast_to_pointset(sphere):
     casted = sphere.cast_to_pointset()
     assert isinstance(casted, vtkPointSet)
-    assert np.allclose(sphere.points, casted.points)
+    assert np.array_equal(sphere.points, casted.points)
 
 
-def test_cell_points(cube):
+def test_cell_queries(cube, sphere):
+    # exercise all per-cell lookups against one cube rather than
+    # rebuilding the fixture for each query
     points = cube.cell_points(0)
     assert len(points) == 4
-
-
-def test_cell_bounds(cube):
-    bounds = cube.cell_bounds(0)
-    assert len(bounds) == 6
-
-
-def test_cell_type(cube, sphere):
+    assert len(cube.cell_bounds(0)) == 6
     assert cube.cell_type(0) == VTK_QUAD
     assert sphere.cell_type(0) == VTK_TRIANGLE
-
-
-def test_cell_point_ids(cube):
     point_ids = cube.cell_point_ids(0)
     assert len(point_ids) == 4
-    points = cube.cell_points(0)
     verify = cube.points[point_ids]
-    assert np.allclose(points, verify)
+    assert np.array_equal(points, verify)
+
+
+def test_batch_cell_queries(cube, hexbeam):
+    # generic fallbacks on a PolyData
+    assert np.array_equal(cube.all_cell_types(), [cube.cell_type(i) for i in range(cube.n_cells)])
+    bounds = cube.all_cell_bounds()
+    assert bounds.shape == (cube.n_cells, 6)
+    assert np.array_equal(bounds[0], cube.cell_bounds(0))
+    assert np.array_equal(cube.all_cell_point_ids()[0], cube.cell_point_ids(0))
+    # zero-copy overrides on an UnstructuredGrid
+    assert np.array_equal(hexbeam.all_cell_types(), hexbeam.celltypes)
+    ids = hexbeam.all_cell_point_ids()
+    assert len(ids) == hexbeam.n_cells
+    assert np.array_equal(ids[0], hexbeam.cell_point_ids(0))
@@ -6,12 +6,12 @@ from vtk_override.datamodel.pointset.structured import StructuredGrid
 from vtk_override.datamodel.rectilinear import RectilinearGrid
 
 
-def test_image_data_override(wavelet):
-    assert isinstance(wavelet, ImageData)
-    assert isinstance(wavelet.dimensions, tuple)
-    assert isinstance(wavelet.origin, tuple)
-    assert isinstance(wavelet.spacing, tuple)
-    assert isinstance(wavelet.extent, tuple)
+def test_image_data_override(wavelet_ro):
+    assert isinstance(wavelet_ro, ImageData)
+    assert isinstance(wavelet_ro.dimensions, tuple)
+    assert isinstance(wavelet_ro.origin, tuple)
+    assert isinstance(wavelet_ro.spacing, tuple)
+    assert isinstance(wavelet_ro.extent, tuple)
 
 
 def test_image_data_points():
@@ -30,12 +30,12 @@ def test_image_data_points():
             [1.0, 1.0, 1.0],
         ]
     )
-    assert np.allclose(image.points, points)
+    assert np.array_equal(image.points, points)
     with pytest.raises(AttributeError):
         image.points = np.random.rand(image.n_points, 3)
-    assert np.allclose(image.x, points[:, 0])
-    assert np.allclose(image.y, points[:, 1])
-    assert np.allclose(image.z, points[:, 2])
+    assert np.array_equal(image.x, points[:, 0])
+    assert np.array_equal(image.y, points[:, 1])
+    assert np.array_equal(image.z, points[:, 2])
 
 
 def test_image_data_properties(wavelet):
@@ -70,7 +70,9 @@ def test_cast_image_to_rectilinear_grid():
 
 
 def test_image_eq(wavelet):
-    copy = wavelet.copy(deep=True)
+    # shallow copy: the test only mutates the copy's origin and its own
+    # vtkPointData array listing, never the shared arrays
+    copy = wavelet.copy(deep=False)
     copy.origin = [1, 1, 1]
     assert wavelet != copy
 
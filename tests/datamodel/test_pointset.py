@@ -20,6 +20,17 @@ def test_pointset_points_to_double():
     assert mesh.points.dtype == np.dtype("float64")
 
 
+def test_pointset_points_to_float32(cube):
+    mesh = cube.copy()
+    mesh.points_to_double()
+    assert mesh.points.dtype == np.dtype("float64")
+    mesh.points_to_float32()
+    assert mesh.points.dtype == np.dtype("float32")
+    # already single precision: no-op
+    mesh.points_to_float32()
+    assert mesh.points.dtype == np.dtype("float32")
+
+
 def test_pointset_cast_to_polydata(sphere):
     pset = vtkPointSet()
     pset.points = sphere.points
@@ -70,3 +70,22 @@ def test_cast_rectilinear_to_structured_grid():
     #     assert np.allclose(structured_grid.point_data[k], v)
     # for k, v in grid.cell_data.items():
     #     assert np.allclose(structured_grid.cell_data[k], v)
+
+
+def test_rectilinear_points_inplace_coordinate_write():
+    grid = RectilinearGrid([0.0, 1.0], [0.0, 1.0], [0.0, 1.0])
+    assert grid.points[:, 0].max() == 1.0
+    # writes through the zero-copy coordinate views must invalidate
+    # the cached points
+    grid.x[1] = 2.0
+    assert grid.points[:, 0].max() == 2.0
+
+
+def test_rectilinear_points_into():
+    xrng = np.arange(-10, 10, 2, dtype=float)
+    yrng = np.arange(-10, 10, 5, dtype=float)
+    zrng = np.arange(-10, 10, 1, dtype=float)
+    grid = RectilinearGrid(xrng, yrng, zrng)
+    out = np.empty((grid.n_points, 3))
+    assert grid.points_into(out) is out
+    assert np.allclose(out, grid.points)
@@ -1,3 +1,7 @@
+import numpy as np
+from vtkmodules.vtkCommonCore import vtkIdList
+
+
 def test_unstructured_grid_eq(hexbeam):
     copy = hexbeam.copy()
     assert hexbeam == copy
@@ -10,3 +14,13 @@ def test_unstructured_grid_eq(hexbeam):
     # copy = hexbeam.copy()
     # hexbeam.cell_connectivity[0] += 1
     # assert hexbeam != copy
+
+
+def test_unstructured_grid_cell_spans(hexbeam):
+    spans = list(hexbeam.cell_spans())
+    assert len(spans) == hexbeam.n_cells
+    ids = vtkIdList()
+    for i, (cell_type, point_ids) in enumerate(spans):
+        assert cell_type == hexbeam.GetCellType(i)
+        hexbeam.GetCellPoints(i, ids)
+        assert np.array_equal(point_ids, [ids.GetId(j) for j in range(ids.GetNumberOfIds())])
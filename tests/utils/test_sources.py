@@ -0,0 +1,12 @@
+import numpy as np
+
+from vtk_override.utils.sources import Hexbeam
+
+
+def test_hexbeam_copy_isolated():
+    mesh = Hexbeam()
+    original = mesh.points.copy()
+    mesh.points = mesh.points + 10.0
+    fresh = Hexbeam()
+    assert fresh.GetPoints() is not mesh.GetPoints()
+    assert np.array_equal(fresh.points, original)
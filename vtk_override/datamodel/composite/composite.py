@@ -89,6 +89,9 @@ class CompositeDataSetBase(object):
         "Returns the points as a VTKCompositeDataArray instance."
         if self._Points is None or self._Points() is None:
             pts = []
+            # track whether any child contributed real points while
+            # building the list, saving a second pass over the children
+            any_real = False
             for ds in self:
                 try:
                     _pts = ds.Points
@@ -99,9 +102,10 @@ class CompositeDataSetBase(object):
                     pts.append(dsa.NoneArray)
                 else:
                     pts.append(_pts)
-            if len(pts) == 0 or all([a is dsa.NoneArray for a in pts]):
-                cpts = dsa.NoneArray
-            else:
+                    any_real = True
+            if any_real:
                 cpts = dsa.VTKCompositeDataArray(pts, dataset=self)
+            else:
+                cpts = dsa.NoneArray
             self._Points = weakref.ref(cpts)
         return self._Points()
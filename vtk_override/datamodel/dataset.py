@@ -7,29 +7,74 @@ vtkDataSet
  ...
 
 """
-from typing import List, Tuple
+from functools import singledispatchmethod
+from typing import Tuple
 
 import numpy as np
-from vtkmodules.vtkCommonCore import vtkPoints
-from vtkmodules.vtkCommonDataModel import vtkDataSet, vtkPointSet, vtkUnstructuredGrid
+from vtkmodules.vtkCommonCore import vtkIdList, vtkPoints
+from vtkmodules.vtkCommonDataModel import (
+    vtkDataSet,
+    vtkGenericCell,
+    vtkPointSet,
+    vtkUnstructuredGrid,
+)
 from vtkmodules.vtkFiltersCore import vtkAppendFilter
 
 from vtk_override.datamodel.datasetattributes import DataSetAttributes
 from vtk_override.datamodel.object import DataObjectBase
 from vtk_override.utils import override, vtk_ndarray, vtk_points
 from vtk_override.utils._typing import Vector
-from vtk_override.utils.arrays import FieldAssociation, coerce_pointslike_arg, vtk_to_numpy
+from vtk_override.utils.arrays import (
+    FieldAssociation,
+    coerce_pointslike_arg,
+    numpy_to_vtk,
+    vtk_id_list_to_array,
+    vtk_to_numpy,
+)
+
+# hoisted enum lookups for the attribute-wrapper constructors
+_POINT = FieldAssociation.POINT
+_CELL = FieldAssociation.CELL
+
+
+def _arrays_equal(this_arr, that_arr) -> bool:
+    """Compare two numpy views with cheap rejects and a shared-buffer shortcut."""
+    # shape is the only semantics-preserving reject: array_equal is
+    # value-based, so differing dtypes (e.g. float32 vs float64 points)
+    # must still fall through to the value comparison
+    if this_arr.shape != that_arr.shape:
+        return False
+    if (
+        this_arr.dtype == that_arr.dtype
+        and this_arr.dtype.kind != "f"
+        and this_arr.strides == that_arr.strides
+        and this_arr.__array_interface__["data"][0] == that_arr.__array_interface__["data"][0]
+    ):
+        # identical views of one buffer (shallow copies) must hold equal
+        # values; floats are excluded since NaN compares unequal to
+        # itself under array_equal semantics
+        return True
+    return bool(np.array_equal(this_arr, that_arr))
 
 
 class DataSetBase(DataObjectBase):
     def __eq__(self, other):
         """Test equivalency between data objects."""
-        if not isinstance(self, type(other)):
-            return False
-
         if self is other:
             return True
 
+        # identical classes are the common case; only fall back to the
+        # MRO walk (and the reflected comparison) for cross-type pairs
+        if self.__class__ is not other.__class__ and not isinstance(self, type(other)):
+            return NotImplemented
+
+        # cheap scalar probes before touching any point/cell buffers
+        if (
+            self.GetNumberOfPoints() != other.GetNumberOfPoints()
+            or self.GetNumberOfCells() != other.GetNumberOfCells()
+        ):
+            return False
+
         # these attrs use numpy.array_equal
         equal_attrs = [
             "verts",  # DataObject
@@ -41,7 +86,7 @@ class DataSetBase(DataObjectBase):
         ]  # UnstructuredGrid
         for attr in equal_attrs:
             if hasattr(self, attr):
-                if not np.array_equal(getattr(self, attr), getattr(other, attr)):
+                if not _arrays_equal(getattr(self, attr), getattr(other, attr)):
                     return False
 
         # these attrs can be directly compared
@@ -213,19 +258,37 @@ class DataSetBase(DataObjectBase):
 
     @points.setter
     def points(self, points):  # Union[VectorArray, NumericArray, vtkPoints]
+        self._set_points(points)
+
+    @singledispatchmethod
+    def _set_points(self, points):
+        """Dispatch points assignment on the input type.
+
+        The default handles ndarrays and anything array-like that
+        ``coerce_pointslike_arg`` accepts.
+        """
+        self._set_points_array(points)
+
+    def _set_points_array(self, points):
         pdata = self.GetPoints()
-        if isinstance(points, vtk_ndarray):
-            # simply set the underlying data
-            if points.VTKObject is not None and pdata is not None:
-                pdata.SetData(points.VTKObject)
-                pdata.Modified()
-                self.Modified()
-                return
-        # directly set the data if vtk object
-        if isinstance(points, vtkPoints):
-            self.SetPoints(points)
-            if pdata is not None:
-                pdata.Modified()
+        # zero-copy fast path: a contiguous float (n, 3) array needs no
+        # coercion and can back the vtkPoints directly (numpy_to_vtk
+        # keeps a reference to the numpy array on the vtk array)
+        if (
+            isinstance(points, np.ndarray)
+            and points.ndim == 2
+            and points.shape[1] == 3
+            and points.dtype in (np.float32, np.float64)
+            and points.flags["C_CONTIGUOUS"]
+        ):
+            vtk_arr = numpy_to_vtk(points, deep=False)
+            if pdata is None:
+                pts = vtkPoints()
+                pts.SetData(vtk_arr)
+                self.SetPoints(pts)
+            else:
+                pdata.SetData(vtk_arr)
+            self.GetPoints().Modified()
             self.Modified()
             return
         # otherwise, wrap and use the array
@@ -238,13 +301,51 @@ class DataSetBase(DataObjectBase):
         self.GetPoints().Modified()
         self.Modified()
 
+    @_set_points.register
+    def _(self, points: vtkPoints):
+        # directly set the data if vtk object
+        pdata = self.GetPoints()
+        self.SetPoints(points)
+        if pdata is not None:
+            pdata.Modified()
+        self.Modified()
+
+    @_set_points.register
+    def _(self, points: vtk_ndarray):
+        # simply set the underlying data
+        pdata = self.GetPoints()
+        if points.VTKObject is not None and pdata is not None:
+            pdata.SetData(points.VTKObject)
+            pdata.Modified()
+            self.Modified()
+            return
+        # no live VTK array to share; treat it as a plain ndarray
+        self._set_points_array(points)
+
+    def _counts(self) -> Tuple[int, int, int]:
+        """Return (n_arrays, n_points, n_cells), memoized by MTime.
+
+        One GetMTime call validates all three counters, so repeated
+        reads on an unchanged dataset skip the VTK dispatch entirely.
+        """
+        mtime = self.GetMTime()
+        cached = self.__dict__.get("_counts_cache")
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        counts = (
+            self.GetPointData().GetNumberOfArrays()
+            + self.GetCellData().GetNumberOfArrays()
+            + self.GetFieldData().GetNumberOfArrays(),
+            self.GetNumberOfPoints(),
+            self.GetNumberOfCells(),
+        )
+        self._counts_cache = (mtime, counts)
+        return counts
+
     @property
     def n_arrays(self) -> int:
         """Return the number of arrays present in the dataset."""
-        n = self.GetPointData().GetNumberOfArrays()
-        n += self.GetCellData().GetNumberOfArrays()
-        n += self.GetFieldData().GetNumberOfArrays()
-        return n
+        return self._counts()[0]
 
     @property
     def n_points(self) -> int:
@@ -262,7 +363,7 @@ class DataSetBase(DataObjectBase):
         8
 
         """
-        return self.GetNumberOfPoints()
+        return self._counts()[1]
 
     @property
     def n_cells(self) -> int:
@@ -285,7 +386,21 @@ class DataSetBase(DataObjectBase):
         6
 
         """
-        return self.GetNumberOfCells()
+        return self._counts()[2]
+
+    def _geometry(self) -> Tuple[tuple, tuple, float]:
+        """Return (bounds, center, length), memoized by MTime.
+
+        The three queries share one bounding-box computation in VTK, so
+        they are fetched together and reused until the dataset changes.
+        """
+        mtime = self.GetMTime()
+        cached = self.__dict__.get("_geometry_cache")
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        geometry = (self.GetBounds(), tuple(self.GetCenter()), self.GetLength())
+        self._geometry_cache = (mtime, geometry)
+        return geometry
 
     @property
     def bounds(self) -> Tuple[float, float, float, float, float, float]:
@@ -304,7 +419,7 @@ class DataSetBase(DataObjectBase):
         (-0.5, 0.5, -0.5, 0.5, -0.5, 0.5)
 
         """
-        return self.GetBounds()
+        return self._geometry()[0]
 
     @property
     def length(self) -> float:
@@ -323,7 +438,7 @@ class DataSetBase(DataObjectBase):
         1.7320508075688772
 
         """
-        return self.GetLength()
+        return self._geometry()[2]
 
     @property
     def center(self) -> Vector:
@@ -337,10 +452,10 @@ class DataSetBase(DataObjectBase):
         >>> from vtk_override.utils import Sphere
         >>> mesh = Sphere(center=(1, 2, 0))
         >>> mesh.center
-        [1.0, 2.0, 0.0]
+        (1.0, 2.0, 0.0)
 
         """
-        return list(self.GetCenter())
+        return self._geometry()[1]
 
     def cell_points(self, ind: int) -> np.ndarray:
         """Return the points in a cell.
@@ -357,10 +472,15 @@ class DataSetBase(DataObjectBase):
             cell corners.
 
         """
-        # A copy of the points must be returned to avoid overlapping them since the
-        # `vtk.vtkExplicitStructuredGrid.GetCell` is an override method.
-        points = self.GetCell(ind).GetPoints().GetData()
-        points = vtk_to_numpy(points)
+        # Fill a reusable vtkGenericCell rather than letting GetCell(ind)
+        # populate a temporary wrapper on every call.
+        cell = self.__dict__.get("_generic_cell")
+        if cell is None:
+            cell = self._generic_cell = vtkGenericCell()
+        self.GetCell(ind, cell)
+        # A copy of the points must be returned since the generic cell's
+        # point storage is overwritten by the next query.
+        points = vtk_to_numpy(cell.GetPoints().GetData())
         return points.copy()
 
     def cell_bounds(self, ind: int) -> Tuple[float, float, float, float, float, float]:
@@ -395,7 +515,7 @@ class DataSetBase(DataObjectBase):
         """
         return self.GetCellType(ind)
 
-    def cell_point_ids(self, ind: int) -> List[int]:
+    def cell_point_ids(self, ind: int) -> np.ndarray:
         """Return the point ids in a cell.
 
         Parameters
@@ -405,13 +525,73 @@ class DataSetBase(DataObjectBase):
 
         Returns
         -------
-        list[int]
+        numpy.ndarray
             Point Ids that are associated with the cell.
 
         """
-        cell = self.GetCell(ind)
-        point_ids = cell.GetPointIds()
-        return [point_ids.GetId(i) for i in range(point_ids.GetNumberOfIds())]
+        # GetCellPoints fills a caller-owned id list in a single call,
+        # avoiding the per-cell wrapper that GetCell(ind) populates.
+        point_ids = vtkIdList()
+        self.GetCellPoints(ind, point_ids)
+        return vtk_id_list_to_array(point_ids)
+
+    def all_cell_types(self) -> np.ndarray:
+        """Return the type of every cell as an array.
+
+        Batch counterpart of :func:`cell_type`; prefer this over
+        calling :func:`cell_type` in a loop.
+
+        Returns
+        -------
+        numpy.ndarray
+            VTK cell type of each cell.
+
+        """
+        return np.array(
+            [self.GetCellType(i) for i in range(self.GetNumberOfCells())], dtype=np.uint8
+        )
+
+    def all_cell_bounds(self) -> np.ndarray:
+        """Return the bounding box of every cell.
+
+        Batch counterpart of :func:`cell_bounds`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with shape (number of cells, 6) holding the limits of
+            each cell in the X, Y and Z directions respectively.
+
+        """
+        cell = self.__dict__.get("_generic_cell")
+        if cell is None:
+            cell = self._generic_cell = vtkGenericCell()
+        bounds = np.empty((self.GetNumberOfCells(), 6))
+        for i in range(bounds.shape[0]):
+            self.GetCell(i, cell)
+            bounds[i] = cell.GetBounds()
+        return bounds
+
+    def all_cell_point_ids(self) -> list:
+        """Return the point ids of every cell.
+
+        Batch counterpart of :func:`cell_point_ids`.  Subclasses with
+        zero-copy access to their connectivity (such as
+        :class:`vtk.vtkUnstructuredGrid`) override this with a single
+        numpy extraction.
+
+        Returns
+        -------
+        list[numpy.ndarray]
+            Point ids of each cell.
+
+        """
+        point_ids = vtkIdList()
+        ids = []
+        for i in range(self.GetNumberOfCells()):
+            self.GetCellPoints(i, point_ids)
+            ids.append(vtk_id_list_to_array(point_ids))
+        return ids
 
     @property
     def point_data(self) -> DataSetAttributes:
@@ -449,9 +629,13 @@ class DataSetBase(DataObjectBase):
         (8,)
 
         """
-        return DataSetAttributes(
-            self.GetPointData(), dataset=self, association=FieldAssociation.POINT
-        )
+        pdata = self.GetPointData()
+        cached = self.__dict__.get("_point_data")
+        if cached is not None and cached.VTKObject is pdata:
+            return cached
+        cached = DataSetAttributes(pdata, dataset=self, association=_POINT)
+        self._point_data = cached
+        return cached
 
     def clear_point_data(self):
         """Remove all point arrays.
@@ -533,9 +717,13 @@ class DataSetBase(DataObjectBase):
         (6,)
 
         """
-        return DataSetAttributes(
-            self.GetCellData(), dataset=self, association=FieldAssociation.CELL
-        )
+        cdata = self.GetCellData()
+        cached = self.__dict__.get("_cell_data")
+        if cached is not None and cached.VTKObject is cdata:
+            return cached
+        cached = DataSetAttributes(cdata, dataset=self, association=_CELL)
+        self._cell_data = cached
+        return cached
 
 
 @override(vtkDataSet)
@@ -1,5 +1,3 @@
-import weakref
-
 import numpy
 from vtkmodules.numpy_interface import dataset_adapter as dsa
 from vtkmodules.vtkCommonDataModel import (
@@ -28,6 +26,16 @@ class FieldDataBase(object):
         "Given an index or name, returns a VTKArray."
         if isinstance(idx, int) and idx >= self.GetNumberOfArrays():
             raise IndexError("array index out of range")
+        # the wrapped views are zero-copy over VTK memory, so caching
+        # them per MTime only skips the rewrapping, never the data
+        mtime = self.GetMTime()
+        cache = self.__dict__.get("_array_cache")
+        if cache is None or cache[0] != mtime:
+            cache = (mtime, {})
+            self._array_cache = cache
+        array = cache[1].get(idx)
+        if array is not None:
+            return array
         vtkarray = super().GetArray(idx)
         if not vtkarray:
             vtkarray = self.GetAbstractArray(idx)
@@ -36,26 +44,39 @@ class FieldDataBase(object):
             return dsa.NoneArray
         array = dsa.vtkDataArrayToVTKArray(vtkarray, self.dataset)
         array.Association = self.association
+        cache[1][idx] = array
         return array
 
     def keys(self):
         """Returns the names of the arrays as a list."""
+        mtime = self.GetMTime()
+        cached = self.__dict__.get("_keys_cache")
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         kys = []
         narrays = self.GetNumberOfArrays()
         for i in range(narrays):
-            name = self.GetAbstractArray(i).GetName()
+            # GetArrayName avoids materializing the array wrapper just
+            # to read its name
+            name = self.GetArrayName(i)
             if name:
                 kys.append(name)
+        self._keys_cache = (mtime, kys)
         return kys
 
     def values(self):
         """Returns the arrays as a list."""
+        mtime = self.GetMTime()
+        cached = self.__dict__.get("_values_cache")
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         vals = []
         narrays = self.GetNumberOfArrays()
         for i in range(narrays):
-            a = self.get_array(i)
-            if a.GetName():
-                vals.append(a)
+            # probe the name first so unnamed arrays never get wrapped
+            if self.GetArrayName(i):
+                vals.append(self.get_array(i))
+        self._values_cache = (mtime, vals)
         return vals
 
     def set_array(self, name, narray):
@@ -77,17 +98,17 @@ class FieldDataBase(object):
                 arrLength = narray.shape[0]
 
         # Fixup input array length:
-        if not isinstance(narray, numpy.ndarray) or numpy.ndim(narray) == 0:  # Scalar input
+        if not isinstance(narray, numpy.ndarray) or narray.ndim == 0:  # Scalar input
             dtype = narray.dtype if isinstance(narray, numpy.ndarray) else type(narray)
-            tmparray = numpy.empty(arrLength, dtype=dtype)
-            tmparray.fill(narray)
-            narray = tmparray
+            narray = numpy.full(arrLength, narray, dtype=dtype)
         elif narray.shape[0] != arrLength:  # Vector input
             components = 1
             for l in narray.shape:
                 components *= l
             tmparray = numpy.empty((arrLength, components), dtype=narray.dtype)
-            tmparray[:] = narray.flatten()
+            # reshape(-1) is a view for contiguous input where
+            # flatten() always allocated a full copy first
+            tmparray[:] = narray.reshape(-1)
             narray = tmparray
 
         shape = narray.shape
@@ -95,34 +116,42 @@ class FieldDataBase(object):
         if len(shape) == 3:
             # Array of matrices. We need to make sure the order  in memory is right.
             # If column order (c order), transpose. VTK wants row order (fortran
-            # order). The deep copy later will make sure that the array is contiguous.
-            # If row order but not contiguous, transpose so that the deep copy below
+            # order). The contiguous copy below will then linearize the result.
+            # If row order but not contiguous, transpose so that the copy below
             # does not happen.
             size = narray.dtype.itemsize
-            if (narray.strides[1] / size == 3 and narray.strides[2] / size == 1) or (
-                narray.strides[1] / size == 1
-                and narray.strides[2] / size == 3
+            # compare strides by multiplication instead of float division
+            if (narray.strides[1] == 3 * size and narray.strides[2] == size) or (
+                narray.strides[1] == size
+                and narray.strides[2] == 3 * size
                 and not narray.flags.contiguous
             ):
                 narray = narray.transpose(0, 2, 1)
 
-        # If array is not contiguous, make a deep copy that is contiguous
-        if not narray.flags.contiguous:
+        # If array is not C-contiguous, make a deep copy that is
+        if not narray.flags.c_contiguous:
             narray = numpy.ascontiguousarray(narray)
 
         # Flatten array of matrices to array of vectors
         if len(shape) == 3:
             narray = narray.reshape(shape[0], shape[1] * shape[2])
 
-        # this handle the case when an input array is directly appended on the
-        # output. We want to make sure that the array added to the output is not
-        # referring to the input dataset.
-        copy = dsa.VTKArray(narray)
-        try:
-            copy.VTKObject = narray.VTKObject
-        except AttributeError:
-            pass
-        arr = dsa.numpyTovtkDataArray(copy, name)
+        # The VTKArray rewrap handles the case when an input array is
+        # directly appended on the output: the array added must not
+        # refer to the input dataset.  Plain ndarrays carry no dataset
+        # attribution, so only rewrap actual VTKArrays instead of
+        # paying for the view and an AttributeError per call.
+        # Note that numpyTovtkDataArray is already zero-copy for a
+        # contiguous input: numpy_to_vtk hands VTK the numpy buffer and
+        # pins the array on the resulting vtkDataArray, so no extra
+        # SetVoidArray plumbing is needed here.
+        if isinstance(narray, dsa.VTKArray):
+            copy = dsa.VTKArray(narray)
+            vtkobject = getattr(narray, "VTKObject", None)
+            if vtkobject is not None:
+                copy.VTKObject = vtkobject
+            narray = copy
+        arr = dsa.numpyTovtkDataArray(narray, name)
         self.AddArray(arr)
 
 
@@ -169,15 +198,16 @@ class CompositeDataSetAttributes(object):
         self.__determine_arraynames()
 
     def __determine_arraynames(self):
-        array_set = set()
-        array_list = []
-        for dataset in self.DataSet:
-            dsa = dataset.GetAttributes(self.Association)
-            for array_name in dsa.keys():
-                if array_name not in array_set:
-                    array_set.add(array_name)
-                    array_list.append(array_name)
-        self.ArrayNames = array_list
+        # a dict comprehension de-duplicates in insertion order inside
+        # CPython's dict implementation, replacing the paired
+        # set-membership test and list append per name
+        self.ArrayNames = list(
+            {
+                array_name: None
+                for dataset in self.DataSet
+                for array_name in dataset.GetAttributes(self.Association).keys()
+            }
+        )
 
     def keys(self):
         """Returns the names of the arrays as a list."""
@@ -213,18 +243,21 @@ class CompositeDataSetAttributes(object):
                     added = True
             if added:
                 self.ArrayNames.append(name)
-                self.Arrays[name] = weakref.ref(narray)
+                self.Arrays[name] = narray
 
     def get_array(self, idx):
         """Given a name, returns a VTKCompositeArray."""
         arrayname = idx
         if arrayname not in self.ArrayNames:
             return dsa.NoneArray
-        if arrayname not in self.Arrays or self.Arrays[arrayname]() is None:
+        # a plain dict keeps the composite wrappers alive for the
+        # attributes' own lifetime, sparing the weakref deref and
+        # rebuild-on-expiry per access; ArrayNames already bounds the
+        # cache size
+        array = self.Arrays.get(arrayname)
+        if array is None:
             array = dsa.VTKCompositeDataArray(
                 dataset=self.DataSet, name=arrayname, association=self.Association
             )
-            self.Arrays[arrayname] = weakref.ref(array)
-        else:
-            array = self.Arrays[arrayname]()
+            self.Arrays[arrayname] = array
         return array
@@ -15,18 +15,21 @@ from vtk_override.utils import override
 
 
 class ImageDataBase(DataSetBase):
+    # property name -> VTK setter name, shared by all instances and
+    # filled on first use so repeated construction skips the string
+    # building
+    _SETTER_NAMES: dict = {}
+
     def __init__(self, **properties):
         for name, value in properties.items():
             self.set_property(name, value)
 
     def set_property(self, name, value):
-        from collections.abc import Iterable
-
-        parts = name.split("_")
-        method = "Set"
-        for part in [part.capitalize() for part in parts]:
-            method += part
-        if isinstance(value, Iterable):
+        method = self._SETTER_NAMES.get(name)
+        if method is None:
+            method = "Set" + "".join(part.capitalize() for part in name.split("_"))
+            self._SETTER_NAMES[name] = method
+        if isinstance(value, (tuple, list, np.ndarray)):
             getattr(self, method)(*value)
         else:
             getattr(self, method)(value)
@@ -83,20 +86,38 @@ class ImageDataBase(DataSetBase):
                [1., 1., 1.]])
 
         """
+        # x, y and z each come through here, so asking for all three
+        # axes would otherwise rebuild the full grid three times
+        mtime = self.GetMTime()
+        cached = self.__dict__.get("_points_cache")
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         # Get grid dimensions
         nx, ny, nz = self.dimensions
-        nx -= 1
-        ny -= 1
-        nz -= 1
         # get the points and convert to spacings
         dx, dy, dz = self.spacing
-        # Now make the cell arrays
-        ox, oy, oz = np.array(self.origin) + np.array(self.extent[::2])  # type: ignore
-        x = np.insert(np.cumsum(np.full(nx, dx)), 0, 0.0) + ox
-        y = np.insert(np.cumsum(np.full(ny, dy)), 0, 0.0) + oy
-        z = np.insert(np.cumsum(np.full(nz, dz)), 0, 0.0) + oz
-        xx, yy, zz = np.meshgrid(x, y, z, indexing="ij")
-        return np.c_[xx.ravel(order="F"), yy.ravel(order="F"), zz.ravel(order="F")]
+        # tuple arithmetic; a 3-element ufunc costs more in dispatch
+        # than the three additions
+        origin = self.origin
+        extent = self.extent
+        ox = origin[0] + extent[0]
+        oy = origin[1] + extent[2]
+        oz = origin[2] + extent[4]
+        # The coordinates are affine in (i, j, k), so write each column
+        # of the x-fastest point ordering straight into one (N, 3)
+        # buffer; no meshgrid expansion or column stacking required.
+        # Reuse the previous buffer when only origin/spacing moved and
+        # the point count is unchanged, amortizing the allocation.
+        n = nx * ny * nz
+        if cached is not None and cached[1].shape[0] == n:
+            points = cached[1]
+        else:
+            points = np.empty((n, 3))
+        points[:, 0] = np.tile(np.arange(nx) * dx + ox, ny * nz)
+        points[:, 1] = np.tile(np.repeat(np.arange(ny) * dy + oy, nx), nz)
+        points[:, 2] = np.repeat(np.arange(nz) * dz + oz, nx * ny)
+        self._points_cache = (mtime, points)
+        return points
 
     @points.setter
     def points(self, points):
@@ -234,16 +255,13 @@ class ImageDataBase(DataSetBase):
 
         """
 
-        def gen_coords(i):
-            coords = (
-                np.cumsum(np.insert(np.full(self.dimensions[i] - 1, self.spacing[i]), 0, 0))
-                + self.origin[i]
-            )
-            return coords
-
-        xcoords = gen_coords(0)
-        ycoords = gen_coords(1)
-        zcoords = gen_coords(2)
+        # the coordinates are affine, so a scaled arange per axis beats
+        # the former cumsum-over-full pipeline (and the helper closure
+        # it lived in)
+        xcoords, ycoords, zcoords = (
+            np.arange(dim, dtype=float) * spacing + origin
+            for dim, spacing, origin in zip(self.dimensions, self.spacing, self.origin)
+        )
         grid = vtkRectilinearGrid()
         grid.x = xcoords
         grid.y = ycoords
@@ -7,6 +7,9 @@ from vtk_override.datamodel.datasetattributes import DataSetAttributes
 from vtk_override.utils import override
 from vtk_override.utils.arrays import FieldAssociation
 
+# hoisted enum lookup for the field-data wrapper constructor
+_FIELD = FieldAssociation.NONE
+
 
 class DataObjectBase:
     """A wrapper for vtkDataObject that makes it easier to access FieldData
@@ -73,6 +76,15 @@ class DataObjectBase:
             Deep or shallow copy of the input.  Type is identical to
             the input.
 
+        Notes
+        -----
+        A deep copy duplicates every buffer eagerly through VTK's C++
+        ``DeepCopy``; a copy-on-write mode is not offered because VTK
+        owns and reference-counts its arrays internally, so their
+        storage cannot be rebacked with lazily-shared pages from
+        Python.  When sharing is acceptable, ``deep=False`` already
+        shares every array with the original.
+
         Examples
         --------
         Create and make a deep copy of a PolyData object.
@@ -156,9 +168,13 @@ class DataObjectBase:
         vtk_ndarray([0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
 
         """
-        return DataSetAttributes(
-            self.GetFieldData(), dataset=self, association=FieldAssociation.NONE
-        )
+        fdata = self.GetFieldData()
+        cached = self.__dict__.get("_field_data")
+        if cached is not None and cached.VTKObject is fdata:
+            return cached
+        cached = DataSetAttributes(fdata, dataset=self, association=_FIELD)
+        self._field_data = cached
+        return cached
 
     def clear_field_data(self):
         """Remove all field data.
@@ -1,6 +1,5 @@
 from typing import Tuple
 
-import numpy as np
 from vtkmodules.vtkCommonDataModel import vtkExplicitStructuredGrid, vtkUnstructuredGrid
 from vtkmodules.vtkFiltersCore import vtkExplicitStructuredGridToUnstructuredGrid
 
@@ -46,11 +45,10 @@ class ExplicitStructuredGrid(PointSetBase, vtkExplicitStructuredGrid):
         # This method is required to avoid conflict if a developer extends `ExplicitStructuredGrid`
         # and reimplements `dimensions` to return, for example, the number of cells in the I, J and
         # K directions.
-        dims = self.GetExtent()
-        dims = np.reshape(dims, (3, 2))
-        dims = np.diff(dims, axis=1)
-        dims = dims.flatten() + 1
-        return int(dims[0]), int(dims[1]), int(dims[2])
+        # plain tuple arithmetic; spinning up numpy for six ints costs
+        # orders of magnitude more than the subtraction itself
+        e = self.GetExtent()
+        return e[1] - e[0] + 1, e[3] - e[2] + 1, e[5] - e[4] + 1
 
     @property
     def dimensions(self) -> Tuple[int, int, int]:
@@ -8,12 +8,58 @@ from vtk_override.utils._typing import ID_TYPE
 from vtk_override.utils.arrays import vtk_to_numpy
 
 
+def _overwrite_connectivity(carr, cells):
+    """Overwrite an existing cell array in place, if the layout allows.
+
+    Returns ``True`` when ``cells`` (legacy ``[n0, p0_0, ...]`` layout)
+    describes the same cell sizes as ``carr`` and its connectivity was
+    written directly into the live VTK buffers, skipping a full
+    ``CellArray`` rebuild.  Note the array returned by ``GetData()``
+    cannot be used for this: in VTK 9 it is re-exported from the
+    offsets/connectivity storage on every call, so writes to it are
+    discarded.
+    """
+    if carr is None or carr.GetNumberOfCells() == 0:
+        return False
+    offsets = vtk_to_numpy(carr.GetOffsetsArray())
+    conn = vtk_to_numpy(carr.GetConnectivityArray())
+    if cells.size != offsets.size - 1 + conn.size:
+        return False
+    # the header entries must reproduce the existing cell sizes for the
+    # offsets array to remain valid
+    header_pos = offsets[:-1] + np.arange(offsets.size - 1)
+    if not np.array_equal(cells[header_pos], np.diff(offsets)):
+        return False
+    mask = np.ones(cells.size, dtype=bool)
+    mask[header_pos] = False
+    conn[:] = cells[mask]
+    carr.Modified()
+    return True
+
+
 @override(vtkPolyData)
 class PolyData(PointSetBase, vtkPolyData):
+    def _cached_legacy_view(self, slot, carr):
+        """Return a cached flat numpy view of a cell array's legacy layout.
+
+        ``GetData()`` re-exports the offsets/connectivity storage into
+        the legacy layout on every call — an O(n) pass — so skipping it
+        while the cell array's MTime is unchanged saves the export
+        itself, not just the numpy wrapping.
+        """
+        mtime = carr.GetMTime()
+        cached = self.__dict__.get(slot)
+        if cached is not None and cached[0] is carr and cached[1] == mtime:
+            return cached[2]
+        arr = vtk_to_numpy(carr.GetData()).ravel()
+        self.__dict__[slot] = (carr, mtime, arr)
+        return arr
+
     def make_vertex_cells(self):
-        cells = np.empty((self.n_points, 2), dtype=ID_TYPE)
+        n_points = self.n_points
+        cells = np.empty((n_points, 2), dtype=ID_TYPE)
         cells[:, 0] = 1
-        cells[:, 1] = np.arange(self.n_points, dtype=ID_TYPE)
+        cells[:, 1] = np.arange(n_points, dtype=ID_TYPE)
         self.verts = cells
 
     @property
@@ -37,7 +83,9 @@ class PolyData(PointSetBase, vtkPolyData):
         array([1, 0, 1, 1, 1, 2, 1, 3, 1, 4])
 
         """
-        return vtk_to_numpy(self.GetVerts().GetData())
+        # flat view into VTK memory; callers needing an independent
+        # writable array should .copy()
+        return self._cached_legacy_view("_verts_cache", self.GetVerts())
 
     @verts.setter
     def verts(self, verts):
@@ -45,7 +93,9 @@ class PolyData(PointSetBase, vtkPolyData):
         if isinstance(verts, CellArray):
             self.SetVerts(verts)
         else:
-            self.SetVerts(CellArray(verts))
+            verts = np.asarray(verts, dtype=ID_TYPE).ravel()
+            if not _overwrite_connectivity(self.GetVerts(), verts):
+                self.SetVerts(CellArray(verts))
 
     @property
     def lines(self) -> np.ndarray:
@@ -63,7 +113,7 @@ class PolyData(PointSetBase, vtkPolyData):
         array([10,  0,  1,  2,  3,  4,  5,  6,  7,  8,  9])
 
         """
-        return vtk_to_numpy(self.GetLines().GetData()).ravel()
+        return self._cached_legacy_view("_lines_cache", self.GetLines())
 
     @lines.setter
     def lines(self, lines):
@@ -71,7 +121,9 @@ class PolyData(PointSetBase, vtkPolyData):
         if isinstance(lines, CellArray):
             self.SetLines(lines)
         else:
-            self.SetLines(CellArray(lines))
+            lines = np.asarray(lines, dtype=ID_TYPE).ravel()
+            if not _overwrite_connectivity(self.GetLines(), lines):
+                self.SetLines(CellArray(lines))
 
     @property
     def faces(self) -> np.ndarray:
@@ -98,7 +150,9 @@ class PolyData(PointSetBase, vtkPolyData):
                [4, 3, 4, 7, 6],
                [4, 4, 5, 8, 7]])
         """
-        return vtk_to_numpy(self.GetPolys().GetData())
+        # flat view into VTK memory; callers needing an independent
+        # writable array should .copy()
+        return self._cached_legacy_view("_faces_cache", self.GetPolys())
 
     @faces.setter
     def faces(self, faces):
@@ -106,8 +160,9 @@ class PolyData(PointSetBase, vtkPolyData):
         if isinstance(faces, CellArray):
             self.SetPolys(faces)
         else:
-            # TODO: faster to mutate in-place if array is same size?
-            self.SetPolys(CellArray(faces))
+            faces = np.asarray(faces, dtype=ID_TYPE).ravel()
+            if not _overwrite_connectivity(self.GetPolys(), faces):
+                self.SetPolys(CellArray(faces))
 
     @property
     def n_lines(self) -> int:
@@ -154,4 +209,6 @@ class PolyData(PointSetBase, vtkPolyData):
         4
 
         """
-        return self.n_cells
+        # call VTK directly instead of hopping through the n_cells
+        # property, which would double the Python dispatch per read
+        return self.GetNumberOfCells()
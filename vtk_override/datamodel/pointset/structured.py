@@ -28,11 +28,17 @@ class StructuredGrid(PointSetBase, vtkStructuredGrid):
         (10, 20, 4)
 
         """
-        return tuple(self.GetDimensions())
+        # GetDimensions already comes back as a tuple from the Python
+        # bindings; re-wrapping it allocated a second one per read
+        return self.GetDimensions()
 
     @dimensions.setter
     def dimensions(self, dims):
         """Set the dataset dimensions. Pass a length three tuple of integers."""
-        nx, ny, nz = dims[0], dims[1], dims[2]
-        self.SetDimensions(nx, ny, nz)
-        self.Modified()
+        # return early on a no-op assignment (common when animating
+        # scalars over fixed geometry) before paying the C++ call;
+        # SetDimensions raises Modified itself on change, so no
+        # explicit Modified() is needed either
+        if (dims[0], dims[1], dims[2]) == self.GetDimensions():
+            return
+        self.SetDimensions(dims[0], dims[1], dims[2])
@@ -7,6 +7,22 @@ from vtk_override.utils.arrays import vtk_to_numpy
 
 
 class UnstructuredGridBaseBase(PointSetBase):
+    def _cached_view(self, slot, vtkarr):
+        """Return a cached numpy view of ``vtkarr``, rewrapping on change.
+
+        The views are zero-copy over VTK memory, so caching them only
+        skips the per-access wrapper construction, never the data.  The
+        cache is invalidated when the VTK array is mutated (its MTime
+        advances) or replaced outright.
+        """
+        mtime = vtkarr.GetMTime()
+        cached = self.__dict__.get(slot)
+        if cached is not None and cached[0] is vtkarr and cached[1] == mtime:
+            return cached[2]
+        arr = vtk_to_numpy(vtkarr)
+        self.__dict__[slot] = (vtkarr, mtime, arr)
+        return arr
+
     @property
     def celltypes(self) -> np.ndarray:
         """Return the cell types array.
@@ -67,7 +83,7 @@ class UnstructuredGridBaseBase(PointSetBase):
                dtype=uint8)
 
         """
-        return vtk_to_numpy(self.GetCellTypesArray())
+        return self._cached_view("_celltypes_cache", self.GetCellTypesArray())
 
     @property
     def cell_connectivity(self) -> np.ndarray:
@@ -94,7 +110,7 @@ class UnstructuredGridBaseBase(PointSetBase):
         array([ 0,  2,  8,  7, 27, 36, 90, 81,  2,  1,  4,  8, 36, 18, 54, 90])
 
         """
-        return vtk_to_numpy(self.GetCells().GetConnectivityArray())
+        return self._cached_view("_connectivity_cache", self.GetCells().GetConnectivityArray())
 
     @property
     def offset(self) -> np.ndarray:
@@ -126,7 +142,59 @@ class UnstructuredGridBaseBase(PointSetBase):
         """
         carr = self.GetCells()
         # This will be the number of cells + 1.
-        return vtk_to_numpy(carr.GetOffsetsArray())
+        return self._cached_view("_offset_cache", carr.GetOffsetsArray())
+
+    def all_cell_types(self) -> np.ndarray:
+        """Return the type of every cell as an array.
+
+        Zero-copy view of the cell types array; see
+        :attr:`celltypes`.
+
+        Returns
+        -------
+        numpy.ndarray
+            VTK cell type of each cell.
+
+        """
+        return self.celltypes
+
+    def cell_spans(self):
+        """Yield ``(cell_type, point_ids)`` for every cell.
+
+        Reads the three cell arrays once through their cached views and
+        slices the connectivity per cell, so iterating a grid avoids
+        both per-cell VTK calls and per-iteration property dispatch.
+        The ``point_ids`` are views into the connectivity array.
+
+        Yields
+        ------
+        tuple(numpy.uint8, numpy.ndarray)
+            VTK cell type and point ids of each cell.
+
+        """
+        types = self.celltypes
+        conn = self.cell_connectivity
+        # scalar indexing into a plain list beats numpy scalar indexing
+        # for a sequential walk; see ncells_from_cells
+        offsets = self.offset.tolist()
+        for i, cell_type in enumerate(types):
+            yield cell_type, conn[offsets[i] : offsets[i + 1]]
+
+    def all_cell_point_ids(self) -> list:
+        """Return the point ids of every cell.
+
+        Splits :attr:`cell_connectivity` at the cell offsets, so the
+        whole query is a single numpy extraction rather than one VTK
+        call per cell.
+
+        Returns
+        -------
+        list[numpy.ndarray]
+            Point ids of each cell, as views into the connectivity
+            array.
+
+        """
+        return np.split(self.cell_connectivity, self.offset[1:-1])
 
 
 @override(vtkUnstructuredGridBase)
@@ -5,25 +5,46 @@ from vtkmodules.vtkCommonDataModel import vtkRectilinearGrid, vtkStructuredGrid
 from vtkmodules.vtkFiltersGeneral import vtkRectilinearGridToPointSet
 
 from vtk_override.datamodel.dataset import DataSetBase
-from vtk_override.utils import convert_array, override
+from vtk_override.utils import convert_array, override, vtk_ndarray
 
 
 @override(vtkRectilinearGrid)
 class RectilinearGrid(DataSetBase, vtkRectilinearGrid):
-    def __init__(self, x=None, y=None, z=None):
+    def __init__(self, x=None, y=None, z=None, dtype=None):
         super().__init__()
-        _update = False
-        if x is not None:
-            self.x = x
-            _update = True
-        if y is not None:
-            self.y = y
-            _update = True
-        if z is not None:
-            self.z = z
-            _update = True
-        if _update:
-            self._update_dimensions()
+        if dtype is not None:
+            # optional coordinate coercion, e.g. dtype=np.float32 for
+            # visualization-only grids: every later points
+            # materialization then moves half the bytes of the default
+            # float64 storage, at the cost of coordinate precision
+            x, y, z = (
+                None if coords is None else np.ascontiguousarray(coords, dtype=dtype)
+                for coords in (x, y, z)
+            )
+        if x is not None and y is not None and z is not None:
+            self._set_coords(x, y, z)
+        else:
+            # each setter syncs the dimensions itself
+            if x is not None:
+                self.x = x
+            if y is not None:
+                self.y = y
+            if z is not None:
+                self.z = z
+
+    def _set_coords(self, x, y, z):
+        """Set all three coordinate arrays in one pass.
+
+        Converts the three arrays with a single shared promoted dtype
+        and syncs the dimensions once, instead of one conversion and
+        one dimension sync per axis setter.
+        """
+        x, y, z = (np.asarray(coords) for coords in (x, y, z))
+        dtype = np.result_type(x, y, z)
+        self.SetXCoordinates(convert_array(np.ascontiguousarray(x, dtype=dtype)))
+        self.SetYCoordinates(convert_array(np.ascontiguousarray(y, dtype=dtype)))
+        self.SetZCoordinates(convert_array(np.ascontiguousarray(z, dtype=dtype)))
+        self._update_dimensions()
 
     @property
     def dimensions(self) -> Tuple[int, int, int]:
@@ -59,7 +80,14 @@ class RectilinearGrid(DataSetBase, vtkRectilinearGrid):
 
     def _update_dimensions(self):
         """Update the dimensions if coordinates have changed."""
-        return self.SetDimensions(len(self.x), len(self.y), len(self.z))
+        # read the sizes off the vtkDataArrays directly rather than
+        # going through the x/y/z properties, which would build a numpy
+        # wrapper per axis just to take its len()
+        return self.SetDimensions(
+            self.GetXCoordinates().GetNumberOfTuples(),
+            self.GetYCoordinates().GetNumberOfTuples(),
+            self.GetZCoordinates().GetNumberOfTuples(),
+        )
 
     @property
     def meshgrid(self) -> list:
@@ -101,8 +129,66 @@ class RectilinearGrid(DataSetBase, vtkRectilinearGrid):
                [  0.,   0.,   0.]])
 
         """
-        xx, yy, zz = self.meshgrid
-        return np.c_[xx.ravel(order="F"), yy.ravel(order="F"), zz.ravel(order="F")]
+        # the grid's own MTime does not fold in the coordinate arrays,
+        # so key the cache on all four: writes through the x/y/z views
+        # raise Modified on the coordinate array only
+        mtime = (
+            self.GetMTime(),
+            self.GetXCoordinates().GetMTime(),
+            self.GetYCoordinates().GetMTime(),
+            self.GetZCoordinates().GetMTime(),
+        )
+        cached = self.__dict__.get("_points_cache")
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        x, y, z = self.x, self.y, self.z
+        n = x.size * y.size * z.size
+        dtype = np.result_type(x, y, z)
+        # Reuse the previous buffer when only coordinate values moved
+        # and the point count is unchanged, amortizing the allocation
+        # across repeated reads in time-stepping loops.
+        if cached is not None and cached[1].shape[0] == n and cached[1].dtype == dtype:
+            out = cached[1]
+        else:
+            out = np.empty((n, 3), dtype=dtype)
+        self.points_into(out)
+        self._points_cache = (mtime, out)
+        return out
+
+    def points_into(self, out: np.ndarray) -> np.ndarray:
+        """Fill a caller-owned ``(n_points, 3)`` buffer with the points.
+
+        Fills one flat buffer through a ``(nz, ny, nx, 3)`` view
+        instead of expanding a full meshgrid and column-stacking it:
+        the view matches the Fortran-ravel point ordering and each
+        broadcast assignment is a single strided pass, so no 3D
+        temporaries are materialized.
+
+        Parameters
+        ----------
+        out : numpy.ndarray
+            Preallocated array of shape ``(n_points, 3)`` to write the
+            point coordinates into.
+
+        Returns
+        -------
+        numpy.ndarray
+            The filled ``out`` array.
+
+        """
+        x, y, z = self.x, self.y, self.z
+        # precast each axis to the output dtype once (views when the
+        # types already agree) so the broadcast assignments below are
+        # pure copies rather than cast-and-copy inner loops
+        dtype = out.dtype
+        x = x.astype(dtype, copy=False)
+        y = y.astype(dtype, copy=False)
+        z = z.astype(dtype, copy=False)
+        view = out.reshape(z.size, y.size, x.size, 3)
+        view[..., 0] = x[None, None, :]
+        view[..., 1] = y[None, :, None]
+        view[..., 2] = z[:, None, None]
+        return out
 
     @points.setter
     def points(self, points):
@@ -132,23 +218,26 @@ class RectilinearGrid(DataSetBase, vtkRectilinearGrid):
         >>> zrng = np.arange(-10, 10, 10, dtype=float)
         >>> grid = vtk.vtkRectilinearGrid(xrng, yrng, zrng)
         >>> grid.x
-        array([-10.,   0.])
+        vtk_ndarray([-10.,   0.])
 
         Set the x coordinates of a RectilinearGrid.
 
         >>> grid.x = [-10.0, 0.0, 10.0]
         >>> grid.x
-        array([-10.,   0.,  10.])
+        vtk_ndarray([-10.,   0.,  10.])
 
         """
-        return convert_array(self.GetXCoordinates())
+        # a live view: element writes raise Modified on the
+        # coordinate array so the points cache invalidates
+        return vtk_ndarray(self.GetXCoordinates(), dataset=self)
 
     @x.setter
     def x(self, coords: Sequence):
         """Set the coordinates along the X-direction."""
+        # SetCoordinates and SetDimensions both raise Modified on
+        # change, so no explicit Modified() call is needed here
         self.SetXCoordinates(convert_array(coords))
         self._update_dimensions()
-        self.Modified()
 
     @property
     def y(self) -> np.ndarray:
@@ -165,23 +254,26 @@ class RectilinearGrid(DataSetBase, vtkRectilinearGrid):
         >>> zrng = np.arange(-10, 10, 10, dtype=float)
         >>> grid = vtk.vtkRectilinearGrid(xrng, yrng, zrng)
         >>> grid.y
-        array([-10.,   0.])
+        vtk_ndarray([-10.,   0.])
 
         Set the y coordinates of a RectilinearGrid.
 
         >>> grid.y = [-10.0, 0.0, 10.0]
         >>> grid.y
-        array([-10.,   0.,  10.])
+        vtk_ndarray([-10.,   0.,  10.])
 
         """
-        return convert_array(self.GetYCoordinates())
+        # a live view: element writes raise Modified on the
+        # coordinate array so the points cache invalidates
+        return vtk_ndarray(self.GetYCoordinates(), dataset=self)
 
     @y.setter
     def y(self, coords: Sequence):
         """Set the coordinates along the Y-direction."""
+        # SetCoordinates and SetDimensions both raise Modified on
+        # change, so no explicit Modified() call is needed here
         self.SetYCoordinates(convert_array(coords))
         self._update_dimensions()
-        self.Modified()
 
     @property
     def z(self) -> np.ndarray:
@@ -198,23 +290,26 @@ class RectilinearGrid(DataSetBase, vtkRectilinearGrid):
         >>> zrng = np.arange(-10, 10, 10, dtype=float)
         >>> grid = vtk.vtkRectilinearGrid(xrng, yrng, zrng)
         >>> grid.z
-        array([-10.,   0.])
+        vtk_ndarray([-10.,   0.])
 
         Set the z coordinates of a RectilinearGrid.
 
         >>> grid.z = [-10.0, 0.0, 10.0]
         >>> grid.z
-        array([-10.,   0.,  10.])
+        vtk_ndarray([-10.,   0.,  10.])
 
         """
-        return convert_array(self.GetZCoordinates())
+        # a live view: element writes raise Modified on the
+        # coordinate array so the points cache invalidates
+        return vtk_ndarray(self.GetZCoordinates(), dataset=self)
 
     @z.setter
     def z(self, coords: Sequence):
         """Set the coordinates along the Z-direction."""
+        # SetCoordinates and SetDimensions both raise Modified on
+        # change, so no explicit Modified() call is needed here
         self.SetZCoordinates(convert_array(coords))
         self._update_dimensions()
-        self.Modified()
 
     def cast_to_structured_grid(self) -> vtkStructuredGrid:
         """Cast this rectilinear grid to a structured grid.
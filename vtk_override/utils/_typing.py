@@ -5,7 +5,8 @@ from __future__ import annotations
 from typing import List, Sequence, Tuple, Union
 
 import numpy as np
-from vtkmodules.vtkCommonCore import vtkIdTypeArray
+
+from vtk_override.version import ID_TYPE_CODE
 
 Vector = Union[List[float], Tuple[float, float, float], np.ndarray]
 VectorArray = Union[np.ndarray, Sequence[Vector]]
@@ -15,12 +16,10 @@ NumericArray = Union[Sequence[Number], np.ndarray]
 
 def _get_vtk_id_type():
     """Return the numpy datatype responding to ``vtk.vtkIdTypeArray``."""
-    VTK_ID_TYPE_SIZE = vtkIdTypeArray().GetDataTypeSize()
-    if VTK_ID_TYPE_SIZE == 4:
-        return np.int32
-    elif VTK_ID_TYPE_SIZE == 8:
-        return np.int64
-    return np.int32
+    # numpy_support resolves this from VTK's static type map at import
+    # time, so no vtkIdTypeArray has to be instantiated just to probe
+    # its size
+    return np.int64 if np.dtype(ID_TYPE_CODE).itemsize == 8 else np.int32
 
 
 ID_TYPE = _get_vtk_id_type()
@@ -1,12 +1,13 @@
 """Contains vtk_ndarray a numpy ndarray type."""
 from collections.abc import Iterable
+import ctypes
 from typing import Union
 
 import numpy as np
 from vtkmodules.vtkCommonCore import vtkAbstractArray, vtkWeakReference
 
 from vtk_override.utils.arrays import FieldAssociation, convert_array
-from vtk_override.version import VTK9
+from vtk_override.version import VTK9, get_numpy_array_type
 
 if VTK9:
     from vtkmodules.numpy_interface.dataset_adapter import VTKArray, VTKObjectWrapper
@@ -14,9 +15,43 @@ else:
     from vtk.numpy_interface.dataset_adapter import VTKArray, VTKObjectWrapper
 
 
+def _soa_component_views(array):
+    """Build a numpy array from a SoA data array without the AoS export.
+
+    Returns ``None`` for arrays with the standard interleaved layout.
+    For SoA (structure-of-arrays) storage, ``convert_array`` would go
+    through ``GetVoidPointer``, which generates a full interleaved
+    scalar buffer on every call.  Instead, wrap each component buffer
+    directly: a single-component array comes back as a zero-copy view
+    (the caller must keep the VTK array alive), and a multi-component
+    one as a single column_stack over the component views.
+    """
+    get_pointer = getattr(array, "GetComponentArrayPointer", None)
+    if get_pointer is None or array.HasStandardMemoryLayout():
+        return None
+    n = array.GetNumberOfTuples()
+    if n == 0:
+        return None
+    dtype = np.dtype(get_numpy_array_type(array.GetDataType()))
+    views = []
+    for comp in range(array.GetNumberOfComponents()):
+        # the pointer comes back as a mangled string ('_7f..._p_void')
+        pointer = get_pointer(comp)
+        address = int(pointer[1 : pointer.index("_", 1)], 16)
+        buf = (ctypes.c_char * (n * dtype.itemsize)).from_address(address)
+        views.append(np.frombuffer(buf, dtype=dtype))
+    if len(views) == 1:
+        return views[0]
+    return np.column_stack(views)
+
+
 class vtk_ndarray(np.ndarray):
     """An ndarray which references the owning dataset and the underlying vtkArray."""
 
+    # lazy owning-dataset handle; see the ``dataset`` property
+    _dataset_target = None
+    _dataset_wref = None
+
     def __new__(
         cls,
         array: Union[Iterable, vtkAbstractArray],
@@ -27,7 +62,9 @@ class vtk_ndarray(np.ndarray):
         if isinstance(array, Iterable):
             obj = np.asarray(array).view(cls)
         elif isinstance(array, vtkAbstractArray):
-            obj = convert_array(array).view(cls)
+            soa = _soa_component_views(array)
+            obj = (convert_array(array) if soa is None else soa).view(cls)
+            # also the keepalive for the zero-copy SoA component view
             obj.VTKObject = array
         else:
             raise TypeError(
@@ -36,13 +73,40 @@ class vtk_ndarray(np.ndarray):
             )
 
         obj.association = association
-        obj.dataset = vtkWeakReference()
+        # defer the vtkWeakReference construction to the first .dataset
+        # read; eagerly wrapping here allocated a VTK object per array
+        # even for the many arrays whose owner is never asked for
         if isinstance(dataset, VTKObjectWrapper):
-            obj.dataset.Set(dataset.VTKObject)
-        else:
-            obj.dataset.Set(dataset)
+            dataset = dataset.VTKObject
+        obj._dataset_target = dataset
+        obj._dataset_wref = None
         return obj
 
+    @property
+    def dataset(self):
+        """Return a ``vtkWeakReference`` to the owning dataset.
+
+        The weak reference is constructed lazily on first access and
+        cached; views and slices share the owning-dataset handle
+        through ``__array_finalize__`` without allocating one each.
+        """
+        wref = self._dataset_wref
+        if wref is None:
+            wref = vtkWeakReference()
+            wref.Set(self._dataset_target)
+            self._dataset_wref = wref
+        return wref
+
+    @dataset.setter
+    def dataset(self, value):
+        if isinstance(value, vtkWeakReference):
+            self._dataset_wref = value
+        else:
+            if isinstance(value, VTKObjectWrapper):
+                value = value.VTKObject
+            self._dataset_target = value
+            self._dataset_wref = None
+
     def __array_finalize__(self, obj):
         """Finalize array (associate with parent metadata)."""
         # this is necessary to ensure that views/slices of vtk_ndarray
@@ -53,12 +117,27 @@ class vtk_ndarray(np.ndarray):
         # convention, but here we just map those over to the appropriate
         # attributes of this class
         VTKArray.__array_finalize__(self, obj)
-        if np.shares_memory(self, obj):
-            self.dataset = getattr(obj, "dataset", None)
+        # base identity covers nearly every view, slice and reshape;
+        # np.shares_memory runs a full overlap analysis and is only
+        # consulted when the O(1) checks fail. This runs on every
+        # ufunc output, so it is the hottest path in the file.
+        obj_base = getattr(obj, "base", None)
+        base = self.base
+        if obj is not None and (
+            base is obj
+            or (base is not None and base is obj_base)
+            or obj_base is self
+            or np.shares_memory(self, obj)
+        ):
+            # propagate the lazy handle parts directly so creating a
+            # view never forces the weak reference into existence
+            self._dataset_target = getattr(obj, "_dataset_target", None)
+            self._dataset_wref = getattr(obj, "_dataset_wref", None)
             self.association = getattr(obj, "association", FieldAssociation.NONE)
             self.VTKObject = getattr(obj, "VTKObject", None)
         else:
-            self.dataset = None
+            self._dataset_target = None
+            self._dataset_wref = None
             self.association = FieldAssociation.NONE
             self.VTKObject = None
 
@@ -70,13 +149,28 @@ class vtk_ndarray(np.ndarray):
         object.
         """
         super().__setitem__(key, value)
+        # writing zero elements changes nothing, so skip the Modified
+        # round trips (an empty value can only pair with an empty
+        # selection; anything else raises in the assignment above)
+        if getattr(value, "size", 1) == 0:
+            return
         if self.VTKObject is not None:
+            # one Modified on the array suffices: the owning dataset's
+            # MTime already folds in the array through
+            # vtkFieldData::GetMTime, so a second bump on the dataset
+            # only duplicated the observer fire. Note observers
+            # registered on the dataset itself no longer see a direct
+            # Modified event from array writes.
             self.VTKObject.Modified()
-
-        # the associated dataset should also be marked as modified
-        dataset = self.dataset
-        if dataset is not None and dataset.Get():
-            dataset.Get().Modified()
+            return
+
+        # array not VTK-backed: mark the associated dataset directly;
+        # read the handle parts so the write path never constructs the
+        # weak reference
+        wref = self._dataset_wref
+        target = wref.Get() if wref is not None else self._dataset_target
+        if target is not None:
+            target.Modified()
 
     def __array_wrap__(self, out_arr, context=None):
         """Return a numpy scalar if array is 0d.
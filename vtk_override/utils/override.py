@@ -1,3 +1,4 @@
+import functools
 import warnings
 
 from vtkmodules.vtkCommonCore import vtkObjectBase
@@ -9,6 +10,21 @@ class FailedOverrideWarning(Warning):
     pass
 
 
+def _do_override(to_override: vtkObjectBase, subclass):
+    """Register ``subclass`` as the override for ``to_override``."""
+    try:
+        return to_override.override(subclass)
+    except AttributeError:
+        if WARN_ON_FAILED_OVERRIDE:
+            warnings.warn(
+                FailedOverrideWarning(
+                    f"Unable to override VTK class {to_override} with {subclass} "
+                    "as it has no `override` method. Please make sure VTK is version 9.2 or above."
+                )
+            )
+    return subclass
+
+
 def override(to_override: vtkObjectBase, *args):
     """Class decorator to override VTK classes.
 
@@ -17,21 +33,10 @@ def override(to_override: vtkObjectBase, *args):
     ``WARN_ON_FAILED_OVERRIDE`` is true.
 
     """
-
-    def wrapper(subclass):
-        try:
-            return to_override.override(subclass)
-        except AttributeError:
-            if WARN_ON_FAILED_OVERRIDE:
-                warnings.warn(
-                    FailedOverrideWarning(
-                        f"Unable to override VTK class {to_override} with {subclass} "
-                        "as it has no `override` method. Please make sure VTK is version 9.2 or above."
-                    )
-                )
-        return subclass
-
+    # the two-argument form registers immediately; the decorator form
+    # binds the target with a partial rather than defining a fresh
+    # closure (code object and cell) per decorated class at import
     if len(args):
-        return wrapper(*args)
+        return _do_override(to_override, *args)
 
-    return wrapper
+    return functools.partial(_do_override, to_override)
@@ -1,5 +1,7 @@
+import functools
 from pathlib import Path
 
+from vtkmodules.vtkCommonCore import vtkPoints
 from vtkmodules.vtkFiltersSources import vtkCubeSource, vtkPlaneSource, vtkSphereSource
 from vtkmodules.vtkIOLegacy import vtkDataSetReader
 from vtkmodules.vtkImagingCore import vtkRTAnalyticSource
@@ -81,14 +83,37 @@ def Plane(origin=(0, 0, 0), normal=(0, 0, 1), i_size=1, j_size=1, i_resolution=1
 
     surf = planeSource.GetOutput()
 
-    surf.points[:, 0] *= i_size
-    surf.points[:, 1] *= j_size
+    if i_size != 1 or j_size != 1:
+        # one fetch of the points wrapper and one in-place broadcast
+        # instead of a property-chain write per column, which rebuilt
+        # the wrapper and fired Modified once per axis
+        points = surf.points
+        points[:, :2] *= (i_size, j_size)
     return surf
 
 
-def Hexbeam():
+@functools.lru_cache(maxsize=1)
+def _hexbeam_cached():
     path = str(Path(__file__).parent / "hexbeam.vtk")
     reader = vtkDataSetReader()
     reader.SetFileName(path)
     reader.Update()
     return reader.GetOutput()
+
+
+def Hexbeam():
+    # parse the bundled file once per process; each call hands back a
+    # shallow copy so replacing arrays on the result cannot affect the
+    # cached master (in-place writes through numpy views still can —
+    # use .copy() for a mutable mesh)
+    cached = _hexbeam_cached()
+    out = type(cached)()
+    out.ShallowCopy(cached)
+    # ShallowCopy shares the vtkPoints *instance*, not just its data
+    # array, and the points setter replaces coordinates through
+    # GetPoints().SetData() — give the copy its own vtkPoints around
+    # the shared data array so that write cannot reach the master
+    points = vtkPoints()
+    points.SetData(cached.GetPoints().GetData())
+    out.SetPoints(points)
+    return out
@@ -15,6 +15,7 @@ Denotes the first release candidate.
 
 """
 from collections import namedtuple
+import functools
 import warnings
 
 try:
@@ -24,6 +25,28 @@ try:
 except ImportError:  # pragma: no cover
     VTK9 = False
 
+# Resolve the numpy_support helpers once against the detected VTK
+# layout and re-export them, so the version check is evaluated at a
+# single import site instead of being repeated in every consumer.
+if VTK9:
+    from vtkmodules.util.numpy_support import (  # noqa: F401
+        ID_TYPE_CODE,
+        get_numpy_array_type,
+        get_vtk_array_type,
+        numpy_to_vtk,
+        numpy_to_vtkIdTypeArray,
+        vtk_to_numpy,
+    )
+else:  # pragma: no cover
+    from vtk.util.numpy_support import (  # noqa: F401
+        ID_TYPE_CODE,
+        get_numpy_array_type,
+        get_vtk_array_type,
+        numpy_to_vtk,
+        numpy_to_vtkIdTypeArray,
+        vtk_to_numpy,
+    )
+
 # major, minor, patch
 version_info = 0, 0, 1
 
@@ -31,10 +54,17 @@ version_info = 0, 0, 1
 __version__ = ".".join(map(str, version_info))
 
 
+_VTKVersionInfo = namedtuple("VTKVersionInfo", ["major", "minor", "micro"])
+
+
+@functools.lru_cache(maxsize=1)
 def VTKVersionInfo():
-    """Return the vtk version as a namedtuple."""
-    version_info = namedtuple("VTKVersionInfo", ["major", "minor", "micro"])
+    """Return the vtk version as a namedtuple.
 
+    The version is fixed for the process, so the result is computed
+    once and cached; the namedtuple class lives at module scope
+    instead of being re-created (re-``exec``'d) per call.
+    """
     try:
         ver = vtkVersion()
         major = ver.GetVTKMajorVersion()
@@ -44,4 +74,4 @@ def VTKVersionInfo():
         warnings.warn("Unable to detect VTK version. Defaulting to v4.0.0")
         major, minor, micro = (4, 0, 0)
 
-    return version_info(major, minor, micro)
+    return _VTKVersionInfo(major, minor, micro)